@@ -0,0 +1,27 @@
+"""Renson Healthbox3 Package."""
+
+from .healthbox3 import (
+    Healthbox3,
+    Healthbox3ApiClientAuthenticationError,
+    Healthbox3ApiClientCommunicationError,
+    Healthbox3ApiClientError,
+)
+from .models import (
+    Healthbox3DataObject,
+    Healthbox3FanDataObject,
+    Healthbox3Room,
+    Healthbox3RoomBoost,
+    Healthbox3WIFIConnectionDataObject,
+)
+
+__all__ = [
+    "Healthbox3",
+    "Healthbox3ApiClientAuthenticationError",
+    "Healthbox3ApiClientCommunicationError",
+    "Healthbox3ApiClientError",
+    "Healthbox3DataObject",
+    "Healthbox3FanDataObject",
+    "Healthbox3Room",
+    "Healthbox3RoomBoost",
+    "Healthbox3WIFIConnectionDataObject",
+]
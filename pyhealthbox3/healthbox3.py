@@ -2,13 +2,22 @@ from __future__ import annotations
 
 import asyncio
 
-from aiohttp import ClientSession, ClientError, ClientResponseError
+from aiohttp import ClientSession, ClientError, ClientResponseError, TCPConnector
 from aiohttp.hdrs import METH_GET, METH_PUT, METH_POST
 
 import async_timeout
 
 import logging
 
+try:
+    from orjson import dumps as _orjson_dumps, loads as _json_loads
+
+    def _json_dumps(obj: any) -> str:
+        """Serialize request bodies with orjson."""
+        return _orjson_dumps(obj).decode()
+except ImportError:
+    from json import dumps as _json_dumps, loads as _json_loads
+
 from .models import Healthbox3DataObject, Healthbox3Room, Healthbox3RoomBoost, Healthbox3WIFIConnectionDataObject, Healthbox3FanDataObject
 
 _LOGGER = logging.getLogger(__name__)
@@ -20,11 +29,34 @@ class Healthbox3():
     _close_session: bool = True
     _request_timeout: int = 10
     _advanced_features: bool = False
+    # Backoff between API key status checks, about 10 seconds in total.
+    _api_key_validation_delays: tuple[float, ...] = (0.25, 0.5, 1.0, 2.0, 4.0, 2.25)
+    # The core data (firmware version) only changes across reboots.
+    _core_data_refresh_interval: int = 10
 
     def __init__(self, host: str, api_key: str | None = None , session: ClientSession = None) -> None:
+        """Initialize the Healthbox3 Device.
 
+        Pass a shared session (e.g. Home Assistant's client session) to reuse
+        its connection pool. Without one, a keep-alive session is created on
+        the first request and closed by `close()`.
+        """
         self._host: str = host
         self._session = session
+
+        base_url: str = f"http://{host}"
+        self._url_current: str = f"{base_url}/v2/api/data/current"
+        self._url_errors: str = f"{base_url}/v2/device/error"
+        self._url_core: str = f"{base_url}/renson_core/v2/global"
+        self._url_wifi: str = f"{base_url}/renson_core/v1/wifi/client/status"
+        self._url_fan: str = f"{base_url}/v2/device/fan"
+        self._url_api_key: str = f"{base_url}/v2/api/api_key"
+        self._url_api_key_status: str = f"{base_url}/v2/api/api_key/status"
+        self._url_boost: dict[int, str] = {}
+        self._url_profile: dict[int, str] = {}
+
+        self._core_data: dict | None = None
+        self._core_data_polls: int = 0
         self._close_session = False
 
         if api_key:
@@ -70,6 +102,10 @@ class Healthbox3():
         """Return all HB3 rooms"""
         return self._data.rooms
     
+    def get_room(self, room_id: int) -> Healthbox3Room | None:
+        """Return the HB3 room with the given id."""
+        return self._data.get_room(room_id)
+
     @property
     def firmware_version(self) -> str:
         """Return the Firmware Version."""
@@ -88,15 +124,20 @@ class Healthbox3():
     async def async_get_data(self) -> any:
         """Get data from the API."""
         general_data = await self.request(
-            method=METH_GET, endpoint="/v2/api/data/current"
+            method=METH_GET, url=self._url_current
         )
         self._data = Healthbox3DataObject(general_data, advanced_features=self._advanced_features)
-        await self._async_get_errors()
-        await self._async_get_global_core_data()
-        await self._async_get_wifi_status()
-        await self._async_get_fan_status()
+        await asyncio.gather(
+            self._async_get_errors(),
+            self._async_get_global_core_data(),
+            self._async_get_wifi_status(),
+            self._async_get_fan_status(),
+        )
         # await self._async_packages_data()
-        for room in self._data.rooms:
+        boosts = await asyncio.gather(
+            *(self.async_get_room_boost_data(room_id=room.room_id) for room in self._data.rooms)
+        )
+        for room, boost in zip(self._data.rooms, boosts):
             _LOGGER.debug(f"Found room: {room.name}")
             _LOGGER.debug(f"\tAirflow Ventilation Rate: {room.airflow_ventilation_rate}")
             _LOGGER.debug(f"\tAQI: {room.indoor_aqi}")
@@ -106,7 +147,7 @@ class Healthbox3():
             _LOGGER.debug(f"\tVOC PPM: {room.indoor_voc_ppm}")
             _LOGGER.debug(f"\tVOC µg/m³: {room.indoor_voc_microg_per_cubic}")
 
-            room.boost = await self.async_get_room_boost_data(room_id=room.room_id)
+            room.boost = boost
         return general_data
 
     async def async_change_room_profile(
@@ -116,7 +157,7 @@ class Healthbox3():
         data = f"{profile_name}".lower()
         await self.request(
             method=METH_PUT,
-            endpoint=f"/v2/api/data/current/room/{room_id}/profile_name",
+            url=self._get_profile_url(room_id),
             data=data,
         )
 
@@ -127,7 +168,7 @@ class Healthbox3():
         data = {"enable": True, "level": boost_level, "timeout": boost_timeout}
         await self.request(
             method=METH_PUT,
-            endpoint=f"/v2/api/boost/{room_id}",
+            url=self._get_boost_url(room_id),
             data=data,
         )
 
@@ -136,7 +177,7 @@ class Healthbox3():
         data = {"enable": False}
         await self.request(
             method=METH_PUT,
-            endpoint=f"/v2/api/boost/{room_id}",
+            url=self._get_boost_url(room_id),
             data=data,
         )
 
@@ -144,10 +185,10 @@ class Healthbox3():
         """Get boost data from the API."""
         try:
             data = await self.request(
-                method=METH_GET, endpoint=f"/v2/api/boost/{room_id}"
+                method=METH_GET, url=self._get_boost_url(room_id)
             )
             return Healthbox3RoomBoost(level=data["level"],enabled=data["enable"],remaining=data["remaining"])
-        except:
+        except (Healthbox3ApiClientError, KeyError, TypeError):
             return Healthbox3RoomBoost()
         
     async def _async_get_errors(self) -> list[dict] | None:
@@ -155,30 +196,37 @@ class Healthbox3():
         try:
             _LOGGER.debug("Retreiving errors")
             data = await self.request(
-                method=METH_GET, endpoint=f"/v2/device/error"
+                method=METH_GET, url=self._url_errors
             )
             self._data.error_count = len(data)
-            return data
-        except:
-            return None  
-        finally:
             _LOGGER.debug(f"\tError Count: {self._data.error_count}")
+            return data
+        except (Healthbox3ApiClientError, KeyError, TypeError):
+            return None
 
     async def _async_get_global_core_data(self) -> dict | None:
-        """Get global core data from the API."""
+        """Get global core data from the API, refreshed every few polls."""
+        if self._core_data is None or self._core_data_polls % self._core_data_refresh_interval == 0:
+            try:
+                _LOGGER.debug("Retreiving core data")
+                self._core_data = await self.request(
+                    method=METH_GET, url=self._url_core
+                )
+                self._core_data_polls += 1
+            except Healthbox3ApiClientError:
+                if self._core_data is None:
+                    return None
+                # Retried on the next poll, report the cached data meanwhile.
+                _LOGGER.debug("Refreshing core data failed, using cached data")
+        else:
+            self._core_data_polls += 1
         try:
-            
-            _LOGGER.debug("Retreiving core data")
-            data = await self.request(
-                method=METH_GET, endpoint=f"/renson_core/v2/global"
-            )
-            if "firmware version" in data:
-                self._data.firmware_version = data["firmware version"]
-            return data
-        except:
-            return None  
-        finally:
+            data = self._core_data
+            self._data.firmware_version = data.get("firmware version")
             _LOGGER.debug(f"\tFirmware Version: {self._data.firmware_version}")
+            return data
+        except (AttributeError, KeyError, TypeError):
+            return None
 
     async def _async_get_wifi_status(self) -> Healthbox3WIFIConnectionDataObject | None:
         """Get WiFi status from the API."""
@@ -186,25 +234,24 @@ class Healthbox3():
             
             _LOGGER.debug("Retreiving WiFi Status data")
             data = await self.request(
-                method=METH_GET, endpoint=f"/renson_core/v1/wifi/client/status"
+                method=METH_GET, url=self._url_wifi
+            )
+            wifi_data = Healthbox3WIFIConnectionDataObject(
+                status=data.get("status"),
+                internet_connection=data.get("internet_connection"),
+                ssid=data.get("ssid"),
+                connection_error=data.get("connection_error"),
             )
-            wifi_data = Healthbox3WIFIConnectionDataObject()
 
-            wifi_data.status = data["status"] if "status" in data else None
-            wifi_data.internet_connection = data["internet_connection"] if "internet_connection" in data else None
-            wifi_data.ssid = data["ssid"] if "ssid" in data else None
-            wifi_data.connection_error = data["connection_error"] if "connection_error" in data else None
-            
             self._data.wifi = wifi_data
+            _LOGGER.debug(f"\tStatus: {wifi_data.status}")
+            _LOGGER.debug(f"\tInternet Connection: {wifi_data.internet_connection}")
+            _LOGGER.debug(f"\tSSID: {wifi_data.ssid}")
+            _LOGGER.debug(f"\tConnection Error: {wifi_data.connection_error}")
 
             return wifi_data
-        except:
-            return None  
-        finally:
-            _LOGGER.debug(f"\tStatus: {self._data.wifi.status}")
-            _LOGGER.debug(f"\tInternet Connection: {self._data.wifi.internet_connection}")
-            _LOGGER.debug(f"\tSSID: {self._data.wifi.ssid}")
-            _LOGGER.debug(f"\tConnection Error: {self._data.wifi.status}")
+        except (Healthbox3ApiClientError, AttributeError, KeyError, TypeError):
+            return None
 
     async def _async_get_fan_status(self) -> Healthbox3FanDataObject | None:
         """Get Fan status from the API."""
@@ -212,27 +259,26 @@ class Healthbox3():
 
             _LOGGER.debug("Retreiving Fan Status data")
             data = await self.request(
-                method=METH_GET, endpoint=f"/v2/device/fan"
+                method=METH_GET, url=self._url_fan
+            )
+            fan_data = Healthbox3FanDataObject(
+                voltage=data.get("voltage"),
+                pressure=data.get("pressure"),
+                flow=data.get("flow"),
+                power=data.get("power"),
+                rpm=data.get("rpm"),
             )
-            fan_data = Healthbox3FanDataObject()
-
-            fan_data.voltage = data["voltage"] if "voltage" in data else None
-            fan_data.pressure = data["pressure"] if "pressure" in data else None
-            fan_data.flow = data["flow"] if "flow" in data else None
-            fan_data.power = data["power"] if "power" in data else None
-            fan_data.rpm = data["rpm"] if "rpm" in data else None
 
             self._data.fan = fan_data
+            _LOGGER.debug(f"\tVoltage: {fan_data.voltage}")
+            _LOGGER.debug(f"\tPressure: {fan_data.pressure}")
+            _LOGGER.debug(f"\tFlow: {fan_data.flow}")
+            _LOGGER.debug(f"\tPower: {fan_data.power}")
+            _LOGGER.debug(f"\tRPM: {fan_data.rpm}")
 
             return fan_data
-        except:
+        except (Healthbox3ApiClientError, AttributeError, KeyError, TypeError):
             return None
-        finally:
-            _LOGGER.debug(f"\tVoltage: {self._data.fan.voltage}")
-            _LOGGER.debug(f"\tPressure: {self._data.fan.pressure}")
-            _LOGGER.debug(f"\tFlow: {self._data.fan.flow}")
-            _LOGGER.debug(f"\tPower: {self._data.fan.power}")
-            _LOGGER.debug(f"\tRPM: {self._data.fan.rpm}")
 
     # async def _async_packages_data(self) -> dict | None:
     #     """Get packages data from the API."""
@@ -266,14 +312,37 @@ class Healthbox3():
                 already_valid = await self._async_validate_advanced_api_features()
             if not already_valid:
                 _LOGGER.debug("Enabling Advanced API.")
-                await self.request(
-                    method=METH_POST,
-                    endpoint="/v2/api/api_key",
-                    data=f"{self._api_key}",
-                    expect_json_error=True,
+                post_task = asyncio.create_task(
+                    self.request(
+                        method=METH_POST,
+                        url=self._url_api_key,
+                        data=f"{self._api_key}",
+                        expect_json_error=True,
+                    )
                 )
-                await asyncio.sleep(10)
-                if await self._async_validate_advanced_api_features() == False:
+                enabled = False
+                try:
+                    last_attempt = len(self._api_key_validation_delays) - 1
+                    for attempt, delay in enumerate(self._api_key_validation_delays):
+                        await asyncio.sleep(delay)
+                        if post_task.done() and post_task.exception() is not None:
+                            break
+                        try:
+                            valid = await self._async_validate_advanced_api_features()
+                        except Healthbox3ApiClientError:
+                            # The device may not answer while it applies the key.
+                            if attempt == last_attempt:
+                                raise
+                            _LOGGER.debug("API key status not available yet, retrying.")
+                            continue
+                        if valid:
+                            enabled = True
+                            break
+                    # Surface errors of the API key POST.
+                    await post_task
+                finally:
+                    post_task.cancel()
+                if not enabled:
                     await self.close()
                     raise Healthbox3ApiClientAuthenticationError
             else:
@@ -285,13 +354,13 @@ class Healthbox3():
         """Validate API Connectivity."""
         _LOGGER.debug("Validating Connectivity")
         await self.request(
-            method=METH_GET, endpoint="/v2/api/data/current"
+            method=METH_GET, url=self._url_current
         )
 
     async def _async_validate_advanced_api_features(self) -> bool:
         """Validate API Advanced Features."""
         authentication_status = await self.request(
-            method=METH_GET, endpoint="/v2/api/api_key/status"
+            method=METH_GET, url=self._url_api_key_status
         )
         if authentication_status["state"] != "valid":
             return False
@@ -299,13 +368,33 @@ class Healthbox3():
             self._advanced_features = True
             return True
 
-    async def request(self, endpoint: str, method: str = METH_GET, data: object = None, headers: dict = None, expect_json_error: bool = False) -> any:
-        """Send request to the API."""
+    def _get_boost_url(self, room_id: int) -> str:
+        """Return the (cached) boost URL of a room."""
+        url = self._url_boost.get(room_id)
+        if url is None:
+            url = self._url_boost[room_id] = f"http://{self.host}/v2/api/boost/{room_id}"
+        return url
+
+    def _get_profile_url(self, room_id: int) -> str:
+        """Return the (cached) profile name URL of a room."""
+        url = self._url_profile.get(room_id)
+        if url is None:
+            url = self._url_profile[room_id] = f"http://{self.host}/v2/api/data/current/room/{room_id}/profile_name"
+        return url
+
+    async def request(self, endpoint: str | None = None, method: str = METH_GET, data: object = None, headers: dict = None, expect_json_error: bool = False, url: str | None = None) -> any:
+        """Send request to the API.
+
+        Either an endpoint relative to the device or a full url can be given.
+        """
         if self._session is None:
-            self._session = ClientSession()
+            self._session = self._create_session()
             self._close_session = True
 
-        url: str = f"http://{self.host}{endpoint}"
+        if url is None:
+            if endpoint is None:
+                raise ValueError("Either an endpoint or a url is required")
+            url = f"http://{self.host}{endpoint}"
 
         # _LOGGER.debug(f"{method}, {url}, {data}")
 
@@ -326,7 +415,10 @@ class Healthbox3():
 
                 if expect_json_error:
                     return await response.text()
-                return await response.json()    
+                body = await response.read()
+                if not body.strip():
+                    return None
+                return _json_loads(body)
                         
         except asyncio.TimeoutError as exception:
             raise Healthbox3ApiClientCommunicationError(
@@ -336,13 +428,35 @@ class Healthbox3():
             raise Healthbox3ApiClientError(
                 "Error occurred while communicating with the Healthbox device"
             ) from exception
+        except ValueError as exception:
+            raise Healthbox3ApiClientError(
+                "Invalid JSON received from the Healthbox device"
+            ) from exception
         
+    @staticmethod
+    def _create_session() -> ClientSession:
+        """Create a client session that keeps connections to the device alive."""
+        connector = TCPConnector(
+            limit=10,
+            limit_per_host=4,
+            keepalive_timeout=75,
+            ttl_dns_cache=300,
+        )
+        return ClientSession(connector=connector, json_serialize=_json_dumps)
+
     async def close(self) -> None:
         """Close client session."""
         _LOGGER.debug("Closing clientsession")
         if self._session and self._close_session:
             await self._session.close()   
 
+    async def __aenter__(self) -> Healthbox3:
+        """Async enter.
+        Returns:
+            The Healthbox3 object.
+        """
+        return self
+
     async def __aexit__(self, *_exc_info: any) -> None:
         """Async exit.
         Args:
@@ -2,47 +2,86 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
-from decimal import Decimal
+from functools import cached_property
+from typing import Final
 
+_SENSOR_PARAMETER_KEY: Final[dict[str, str]] = {
+    "indoor volatile organic compounds": "concentration",
+    "indoor air quality index": "index",
+    "indoor CO2": "concentration",
+    "indoor relative humidity": "humidity",
+    "indoor temperature": "temperature",
+}
+
+
+def _ventilation_rate_kernel(flow_rate: float, nominal: float, offset: float) -> float:
+    """Compute the airflow ventilation rate of a room.
+
+    This is a single division per room and poll, so it is deliberately not
+    JIT compiled: Numba's import and dispatch overhead would outweigh it.
+    Only a bulk path over many samples would warrant `numba.njit`.
+    """
+    return flow_rate / (nominal + offset)
+
+@dataclass(slots=True, frozen=True)
 class Healthbox3RoomBoost:
     """Healthbox 3 Room Boost object."""
 
-    level: float
-    enabled: bool
-    remaining: int
-
-    def __init__(
-        self, level: float = None, enabled: bool = False, remaining: int = None
-    ) -> None:
-        """Initialize the HB3 Room Boost."""
-        self.level = level
-        self.enabled = enabled
-        self.remaining = remaining
+    level: float | None = None
+    enabled: bool = False
+    remaining: int | None = None
 
 
 class Healthbox3Room:
     """Healthbox 3 Room object."""
 
-    boost: Healthbox3RoomBoost = Healthbox3RoomBoost()
-    enabled_sensors: list[str] = []
-    
+    __slots__ = (
+        "_advanced_features",
+        "room_id",
+        "name",
+        "type",
+        "sensors_data",
+        "_sensor_by_type",
+        "enabled_sensors",
+        "_parameters",
+        "_actuator",
+        "_air_valve",
+        "_profile",
+        "boost",
+        # Backs the cached_property values, which are computed once per poll.
+        "__dict__",
+    )
+
     def __init__(self, room_id: int, room_data: object, advanced_features: bool = False) -> None:
         """Initialize the HB3 Room."""
         self._advanced_features = advanced_features
         self.room_id: int = room_id
         self.name: str = room_data["name"]
-        self.type: str = room_data["type"]
+        self.type: str = sys.intern(room_data["type"])
         self.sensors_data: list = room_data["sensor"]
-        self.enabled_sensors = [sensor["type"] for sensor in self.sensors_data]
-        self.room_type: str = room_data["type"]
+        self._sensor_by_type: dict[str, dict] = {}
+        for sensor in self.sensors_data:
+            # The first sensor of a type wins, as with a first-match scan.
+            self._sensor_by_type.setdefault(sys.intern(sensor["type"]), sensor)
+        self.enabled_sensors: frozenset[str] = frozenset(self._sensor_by_type)
         self._parameters: dict = room_data["parameter"]
         self._actuator: list[dict] = room_data["actuator"]
-        self._profile: str = room_data["profile_name"]
+        self._air_valve: dict | None = next(
+            (actuator for actuator in self._actuator if actuator.get("type") == "air valve"), None
+        )
+        self._profile: str = sys.intern(room_data["profile_name"])
+        self.boost: Healthbox3RoomBoost = Healthbox3RoomBoost()
 
 
     @property
-    def indoor_temperature(self) -> Decimal | None:
+    def room_type(self) -> str:
+        """HB3 Room Type, alias of type."""
+        return self.type
+
+    @cached_property
+    def indoor_temperature(self) -> float | None:
         """HB3 Indoor Temperature."""
         temperature = None
         sensor_type: str = "indoor temperature"
@@ -50,8 +89,8 @@ class Healthbox3Room:
             temperature = self._get_sensor_value(sensor_type)
         return temperature
 
-    @property
-    def indoor_humidity(self) -> Decimal | None:
+    @cached_property
+    def indoor_humidity(self) -> float | None:
         """HB3 Indoor Humidity."""
         humidity = None
         sensor_type: str = "indoor relative humidity" 
@@ -59,8 +98,8 @@ class Healthbox3Room:
             humidity = self._get_sensor_value(sensor_type)
         return humidity
 
-    @property
-    def indoor_co2_concentration(self) -> Decimal | None:
+    @cached_property
+    def indoor_co2_concentration(self) -> float | None:
         """HB3 Indoor CO2 Concentration."""
         co2_concentration = None
         sensor_type: str = "indoor CO2"
@@ -68,8 +107,8 @@ class Healthbox3Room:
             co2_concentration = self._get_sensor_value(sensor_type)
         return co2_concentration
 
-    @property
-    def indoor_aqi(self) -> Decimal | None:
+    @cached_property
+    def indoor_aqi(self) -> float | None:
         """HB3 Indoor Air Quality Index."""
         aqi = None
         sensor_type: str = "indoor air quality index"
@@ -77,8 +116,8 @@ class Healthbox3Room:
             aqi = self._get_sensor_value(sensor_type)
         return aqi
 
-    @property
-    def indoor_voc_ppm(self) -> Decimal | None:
+    @cached_property
+    def indoor_voc_ppm(self) -> float | None:
         """HB3 Volatile Organic Compounds."""
         ppm = None
         sensor_type: str = "indoor volatile organic compounds"
@@ -86,89 +125,54 @@ class Healthbox3Room:
             ppm = self._get_sensor_value(sensor_type)
         return ppm
     
-    @property
-    def indoor_voc_microg_per_cubic(self) -> Decimal | None:
+    @cached_property
+    def indoor_voc_microg_per_cubic(self) -> float | None:
         """HB3 Volatile Organic Compounds."""
-        mgpc = None
-        sensor_type: str = "indoor volatile organic compounds"
-        if self._advanced_features and sensor_type in self.enabled_sensors:
-            mgpc = self._get_sensor_value(sensor_type)
-            if mgpc:
-                mgpc = mgpc * 1000
+        mgpc = self.indoor_voc_ppm
+        if mgpc is not None:
+            mgpc = mgpc * 1000.0
         return mgpc
     
-    @property
+    @cached_property
     def airflow_ventilation_rate(self) -> float | None:
         """HB3 Airflow Ventilation Rate."""
         ventilation_rate = self._get_airflow_ventilation_rate()
         return ventilation_rate
 
-    @property
+    @cached_property
     def profile_name(self) -> str | None:
         """HB3 Room Profile Name."""
         return self._profile.capitalize()
      
-    def _validate_sensor(self, sensor: dict, sensor_key: str) -> bool:
-        """Validate the sensor."""
-        valid: bool = False
-        if "parameter" in sensor:
-
-            "Sensors are sometimes empty ..."
-            if sensor_key in sensor["parameter"]:
-                valid =  True
-            
-        return valid
-
     def _get_airflow_ventilation_rate(self) -> float | None:
         """Extract the airflow ventilation rate."""
-        nominal: float = None
-        offset: float = None
-        flow_rate: float = None
-
         # Nominal
-        try:
-            nominal = self._parameters["nominal"]["value"]
-        except KeyError:
+        nominal: float | None = self._parameters.get("nominal", {}).get("value")
+        if nominal is None:
             return None
 
         # Offset
-        try:
-            offset = self._parameters["offset"]["value"]
-        except KeyError:            
-            offset = 0
+        offset: float = self._parameters.get("offset", {}).get("value", 0)
 
         # Flow Rate
-        flow_rate_sensors: list[dict] = [
-            x for x in self._actuator if x["type"] == "air valve"
-        ]
-        if len(flow_rate_sensors) == 0:
+        if self._air_valve is None:
             return None
-        
-        try:
-            flow_rate: float = flow_rate_sensors[0]["parameter"]["flow_rate"]["value"]
-        except KeyError:
+        flow_rate: float | None = self._air_valve.get("parameter", {}).get("flow_rate", {}).get("value")
+        if flow_rate is None:
             return None
 
-
-        ventilation_rate: float = flow_rate / (nominal + offset)
+        ventilation_rate: float = _ventilation_rate_kernel(flow_rate, nominal, offset)
         return ventilation_rate
 
     def _get_sensor_value(self, sensor_type: str) -> float | None:
         """Get sensor value."""
-        sensor_type_keys: dict = {
-            "indoor volatile organic compounds": "concentration",
-            "indoor volatile organic compounds": "concentration",
-            "indoor air quality index": "index",
-            "indoor CO2": "concentration",
-            "indoor relative humidity": "humidity",
-            "indoor temperature": "temperature"
-        }
-        sensor: dict = [sensor for sensor in self.sensors_data if sensor_type in sensor["type"]][0]
-        sensor_key = sensor_type_keys[sensor_type]
-        valid = self._validate_sensor(sensor, sensor_key=sensor_key)
-        if valid:
-            return sensor["parameter"][sensor_key]["value"]
-        else:
+        sensor = self._sensor_by_type.get(sensor_type)
+        if sensor is None:
+            return None
+        try:
+            return sensor["parameter"][_SENSOR_PARAMETER_KEY[sensor_type]]["value"]
+        except KeyError:
+            # Sensors are sometimes empty ...
             return None
 
 
@@ -210,20 +214,34 @@ class Healthbox3FanDataObject:
 class Healthbox3DataObject:
     """Healthbox3 Data Object."""
 
+    __slots__ = (
+        "serial",
+        "description",
+        "warranty_number",
+        "global_aqi",
+        "firmware_version",
+        "app_version",
+        "error_count",
+        "rooms",
+        "_rooms_by_id",
+        "wifi",
+        "fan",
+    )
+
     serial: str
     description: str
     warranty_number: str
 
-    global_aqi: float = None
-    firmware_version: str = None
-    app_version: str = None
-    error_count: int = None
+    global_aqi: float
+    firmware_version: str
+    app_version: str
+    error_count: int
 
     rooms: list[Healthbox3Room]
 
-    wifi: Healthbox3WIFIConnectionDataObject = Healthbox3WIFIConnectionDataObject()
+    wifi: Healthbox3WIFIConnectionDataObject
 
-    fan: Healthbox3FanDataObject = Healthbox3FanDataObject()
+    fan: Healthbox3FanDataObject
 
     def __init__(self, data: any, advanced_features: bool = False) -> None:
         """Initialize."""
@@ -231,19 +249,23 @@ class Healthbox3DataObject:
         self.description = data["description"]
         self.warranty_number = data["warranty_number"]
 
-        self.global_aqi = self._get_global_aqi_from_data(data)
+        self.firmware_version = None
+        self.app_version = None
+        self.error_count = None
+        self.wifi = Healthbox3WIFIConnectionDataObject()
+        self.fan = Healthbox3FanDataObject()
 
-        hb3_rooms: list[Healthbox3Room] = []
-        for room in data["room"]:
-            hb3_room = Healthbox3Room(room, data["room"][room], advanced_features=advanced_features)
-            hb3_rooms.append(hb3_room)
+        sensors_by_type: dict[str, dict] = {}
+        for sensor in data["sensor"]:
+            sensors_by_type.setdefault(sensor["type"], sensor.get("parameter", {}))
+        self.global_aqi = sensors_by_type.get("global air quality index", {}).get("index", {}).get("value")
 
-        self.rooms = hb3_rooms
+        self.rooms = [
+            Healthbox3Room(int(room_id), room_data, advanced_features=advanced_features)
+            for room_id, room_data in data["room"].items()
+        ]
+        self._rooms_by_id: dict[int, Healthbox3Room] = {room.room_id: room for room in self.rooms}
 
-    def _get_global_aqi_from_data(self, data: any) -> float | None:
-        """Set Global AQI from Data Object."""
-        sensors = data["sensor"]
-        for sensor in sensors:
-            if sensor["type"] == "global air quality index":
-                return sensor["parameter"]["index"]["value"]
-        return None
+    def get_room(self, room_id: int) -> Healthbox3Room | None:
+        """Return the room with the given id."""
+        return self._rooms_by_id.get(room_id)